@@ -6,6 +6,7 @@ ensuring they meet the required schema and have proper defaults.
 """
 
 import os
+from types import MappingProxyType
 from typing import Any, Dict
 
 from bindu import __version__
@@ -15,8 +16,10 @@ from bindu.common.protocol.types import AgentCapabilities, Skill
 class ConfigValidator:
     """Validates and processes agent configuration."""
 
-    # Default values for optional fields
-    DEFAULTS = {
+    # Default values for optional fields. Wrapped in a read-only proxy so the
+    # shared class-level mapping can never be mutated by callers; per-call
+    # copies happen in validate_and_process.
+    DEFAULTS = MappingProxyType({
         "name": "bindu-agent",
         "description": "A Bindu agent",
         "version": __version__,
@@ -45,7 +48,7 @@ class ConfigValidator:
         "oltp_batch_schedule_delay_millis": 5000,
         "oltp_batch_max_export_batch_size": 512,
         "oltp_batch_export_timeout_millis": 30000,
-    }
+    })
 
     # Required fields that must be present
     REQUIRED_FIELDS = ["author", "deployment"]
@@ -414,6 +414,11 @@ class BinduApplication(Starlette):
             await close_storage(storage)
             logger.info("✅ Storage cleanup complete")
 
+            # Close shared Hydra token clients
+            from bindu.utils.agent_token_utils import close_token_client
+
+            await close_token_client()
+
         return lifespan
 
     def _setup_observability(self) -> None:
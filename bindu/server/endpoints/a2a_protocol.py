@@ -23,6 +23,12 @@ from bindu.extensions.x402.extension import (
 
 logger = get_logger("bindu.server.endpoints.a2a_protocol")
 
+# Error (code, message) pairs resolved once at import - the templates are
+# constant, only the data and request id slots vary per response.
+_JSON_PARSE_ERROR = extract_error_fields(JSONParseError)
+_METHOD_NOT_FOUND_ERROR = extract_error_fields(MethodNotFoundError)
+_INTERNAL_ERROR = extract_error_fields(InternalError)
+
 
 async def agent_run_endpoint(app: BinduApplication, request: Request) -> Response:
     """Handle A2A protocol requests for agent-to-agent communication.
@@ -46,18 +52,21 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
             a2a_request = a2a_request_ta.validate_json(data)
         except Exception as e:
             logger.warning(f"Invalid A2A request from {client_ip}: {e}")
-            code, message = extract_error_fields(JSONParseError)
+            code, message = _JSON_PARSE_ERROR
             return jsonrpc_error(code, message, str(e))
 
         method = a2a_request.get("method")
         request_id = a2a_request.get("id")
 
-        logger.debug(f"A2A request from {client_ip}: method={method}, id={request_id}")
+        # Deferred formatting: args are only rendered if DEBUG is emitted
+        logger.debug(
+            "A2A request from {}: method={}, id={}", client_ip, method, request_id
+        )
 
         handler_name = app_settings.agent.method_handlers.get(method)
         if handler_name is None:
             logger.warning(f"Unsupported A2A method '{method}' from {client_ip}")
-            code, message = extract_error_fields(MethodNotFoundError)
+            code, message = _METHOD_NOT_FOUND_ERROR
             return jsonrpc_error(
                 code, message, f"Method '{method}' is not implemented", request_id, 404
             )
@@ -96,7 +105,9 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
 
         jsonrpc_response = await handler(a2a_request)
 
-        logger.debug(f"A2A response to {client_ip}: method={method}, id={request_id}")
+        logger.debug(
+            "A2A response to {}: method={}, id={}", client_ip, method, request_id
+        )
 
         resp = Response(
             content=a2a_response_ta.dump_json(
@@ -112,5 +123,5 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
 
     except Exception as e:
         logger.error(f"Error processing A2A request from {client_ip}", exc_info=True)
-        code, message = extract_error_fields(InternalError)
+        code, message = _INTERNAL_ERROR
         return jsonrpc_error(code, message, str(e), request_id, 500)
@@ -20,6 +20,15 @@ logger = get_logger("bindu.server.endpoints.health")
 
 _start_time = time()
 
+# Static system facts - computed once per process instead of on every
+# health probe (platform.release() and friends hit the OS each call).
+_SYSTEM_INFO = {
+    "python_version": sys.version.split()[0],
+    "platform": platform.system(),
+    "platform_release": platform.release(),
+    "environment": os.getenv("ENV", "development"),
+}
+
 
 @handle_endpoint_errors("health check")
 async def health_endpoint(app: BinduApplication, request: Request) -> JSONResponse:
@@ -72,12 +81,7 @@ async def health_endpoint(app: BinduApplication, request: Request) -> JSONRespon
             "penguin_id": str(app.penguin_id),
             "agent_did": agent_did,
         },
-        "system": {
-            "python_version": sys.version.split()[0],
-            "platform": platform.system(),
-            "platform_release": platform.release(),
-            "environment": os.getenv("ENV", "development"),
-        },
+        "system": _SYSTEM_INFO,
     }
 
     return JSONResponse(payload)
@@ -17,6 +17,7 @@ Provides REST API endpoints for payment session management:
 
 from __future__ import annotations
 
+import base64
 import json
 
 from starlette.requests import Request
@@ -193,10 +194,8 @@ async def payment_status_endpoint(app: BinduApplication, request: Request) -> Re
     if session.is_completed() and session.payment_payload:
         # Return the payment payload as base64-encoded JSON
         # This can be used directly as X-PAYMENT header
-        import base64
-
         payment_json = session.payment_payload.model_dump_json(by_alias=True)
-        payment_token = base64.b64encode(payment_json.encode("utf-8")).decode("utf-8")
+        payment_token = base64.b64encode(payment_json.encode("utf-8")).decode("ascii")
         response_data["payment_token"] = payment_token
 
     return JSONResponse(content=response_data)
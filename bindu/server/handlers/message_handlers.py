@@ -16,12 +16,13 @@ sending messages and streaming responses.
 from __future__ import annotations
 
 import inspect
-import json
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from bindu.common.protocol.types import (
     SendMessageRequest,
     SendMessageResponse,
@@ -126,7 +127,7 @@ class MessageHandlers:
                     },
                     "final": False,
                 }
-                yield f"data: {json.dumps(status_event)}\n\n"
+                yield b"data: " + orjson.dumps(status_event) + b"\n\n"
 
                 if self.workers and self.manifest:
                     worker = self.workers[0]
@@ -148,7 +149,7 @@ class MessageHandlers:
                                     "append": True,
                                     "last_chunk": False,
                                 }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
+                                yield b"data: " + orjson.dumps(artifact_event) + b"\n\n"
 
                     elif inspect.isgenerator(manifest_result):
                         for chunk in manifest_result:
@@ -165,7 +166,7 @@ class MessageHandlers:
                                     "append": True,
                                     "last_chunk": False,
                                 }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
+                                yield b"data: " + orjson.dumps(artifact_event) + b"\n\n"
 
                     else:
                         if manifest_result:
@@ -182,7 +183,7 @@ class MessageHandlers:
                                 },
                                 "last_chunk": True,
                             }
-                            yield f"data: {json.dumps(artifact_event)}\n\n"
+                            yield b"data: " + orjson.dumps(artifact_event) + b"\n\n"
 
                 # Send completion status
                 completion_event = {
@@ -195,7 +196,7 @@ class MessageHandlers:
                     },
                     "final": True,
                 }
-                yield f"data: {json.dumps(completion_event)}\n\n"
+                yield b"data: " + orjson.dumps(completion_event) + b"\n\n"
 
                 # Update task state in storage
                 await self.storage.update_task(task["id"], state="completed")
@@ -211,7 +212,7 @@ class MessageHandlers:
                     "final": True,
                     "error": str(e),
                 }
-                yield f"data: {json.dumps(error_event)}\n\n"
+                yield b"data: " + orjson.dumps(error_event) + b"\n\n"
                 await self.storage.update_task(task["id"], state="failed")
 
         return StreamingResponse(stream_generator(), media_type="text/event-stream")
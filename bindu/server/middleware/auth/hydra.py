@@ -189,7 +189,9 @@ class HydraMiddleware(AuthMiddleware):
                     }
                 )
 
-        logger.debug(f"Extracted user info for sub={user_info['sub']}, is_m2m={is_m2m}")
+        logger.debug(
+            "Extracted user info for sub={}, is_m2m={}", user_info["sub"], is_m2m
+        )
         return user_info
 
     async def _verify_did_signature(
@@ -204,8 +206,9 @@ class HydraMiddleware(AuthMiddleware):
         Returns:
             Tuple of (is_valid, signature_info)
         """
-        # Extract DID signature headers
-        signature_data = extract_signature_headers(dict(request.headers))
+        # Extract DID signature headers (pass the Headers object directly -
+        # it is case-insensitive, so no full dict copy per request is needed)
+        signature_data = extract_signature_headers(request.headers)
 
         if not signature_data:
             # No DID signature headers present - this is optional for backward compatibility
@@ -286,7 +289,7 @@ class HydraMiddleware(AuthMiddleware):
 
         # Skip authentication for public endpoints
         if self._is_public_endpoint(path):
-            logger.debug(f"Public endpoint: {path}")
+            logger.debug("Public endpoint: {}", path)
             return await call_next(request)
 
         # Extract token
@@ -334,15 +337,19 @@ class HydraMiddleware(AuthMiddleware):
 
             # Add signature info to user context
             user_info["signature_info"] = signature_info
-            logger.debug(f"DID verification result: {signature_info}")
+            logger.debug("DID verification result: {}", signature_info)
 
         # Attach context to request state
         self._attach_user_context(request, user_info, token_payload)
 
+        # Deferred formatting - args are only rendered when DEBUG is enabled,
+        # so the authenticated fast path skips the string work entirely.
         logger.debug(
-            f"Authenticated {path} - sub={user_info.get('sub')}, "
-            f"m2m={user_info.get('is_m2m', False)}, "
-            f"did_verified={user_info.get('signature_info', {}).get('did_verified', False)}"
+            "Authenticated {} - sub={}, m2m={}, did_verified={}",
+            path,
+            user_info.get("sub"),
+            user_info.get("is_m2m", False),
+            user_info.get("signature_info", {}).get("did_verified", False),
         )
 
         return await call_next(request)
@@ -38,11 +38,12 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         metrics.increment_requests_in_flight()
 
         try:
-            # Get request size
+            # Get request size (single header lookup)
             request_size = 0
-            if request.headers.get("content-length"):
+            content_length = request.headers.get("content-length")
+            if content_length:
                 try:
-                    request_size = int(request.headers["content-length"])
+                    request_size = int(content_length)
                 except (ValueError, TypeError):
                     pass
 
@@ -59,11 +60,13 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             response_size = 0
             if hasattr(response, "body") and response.body:
                 response_size = len(response.body)
-            elif response.headers.get("content-length"):
-                try:
-                    response_size = int(response.headers["content-length"])
-                except (ValueError, TypeError):
-                    pass
+            else:
+                content_length = response.headers.get("content-length")
+                if content_length:
+                    try:
+                        response_size = int(content_length)
+                    except (ValueError, TypeError):
+                        pass
 
             # Record metrics
             try:
@@ -80,9 +83,16 @@ class MetricsMiddleware(BaseHTTPMiddleware):
                     response_size=response_size,
                 )
 
+                # Deferred formatting: args are only interpolated when a
+                # DEBUG sink is active, keeping this free per request.
                 logger.debug(
-                    f"Recorded metrics: {method} {endpoint} {status} "
-                    f"{duration:.3f}s req={request_size}B resp={response_size}B"
+                    "Recorded metrics: {} {} {} {:.3f}s req={}B resp={}B",
+                    method,
+                    endpoint,
+                    status,
+                    duration,
+                    request_size,
+                    response_size,
                 )
             except Exception as e:
                 logger.error(f"Failed to record metrics: {e}")
@@ -17,7 +17,7 @@ Based on: https://github.com/coinbase/x402/blob/main/python/x402/src/x402/fastap
 
 from __future__ import annotations
 
-import json
+import orjson
 from web3 import Web3
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -166,7 +166,9 @@ class X402Middleware(BaseHTTPMiddleware):
         # Only methods in app_settings.x402.protected_methods require payment
         try:
             body = await request.body()
-            request_data = json.loads(body.decode("utf-8"))
+            # orjson parses bytes directly and is markedly faster than stdlib
+            # json for the small JSON-RPC envelopes seen here
+            request_data = orjson.loads(body)
             method = request_data.get("method", "")
 
             # Recreate request with consumed body
@@ -204,7 +206,7 @@ class X402Middleware(BaseHTTPMiddleware):
 
         # Decode and parse payment payload
         try:
-            payment_dict = json.loads(safe_base64_decode(payment_header))
+            payment_dict = orjson.loads(safe_base64_decode(payment_header))
             payment_payload = PaymentPayload.model_validate(payment_dict)
         except Exception as e:
             logger.warning(
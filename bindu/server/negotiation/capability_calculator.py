@@ -29,6 +29,7 @@ if TYPE_CHECKING:
 
 # Pre-compiled regex patterns for performance
 _TOKEN_SPLIT_PATTERN = re.compile(r"[^a-z0-9]+")
+_NON_NUMERIC_PATTERN = re.compile(r"[^\d.]")
 
 
 @dataclass(frozen=True)
@@ -617,7 +618,7 @@ class CapabilityCalculator:
         """Parse cost amount string to float."""
         if isinstance(amount, (int, float)):
             return float(amount)
-        cleaned = re.sub(r"[^\d.]", "", str(amount))
+        cleaned = _NON_NUMERIC_PATTERN.sub("", str(amount))
         return float(cleaned) if cleaned else 0.0
 
     def _calculate_confidence(
@@ -55,6 +55,10 @@ PUSH_NOT_SUPPORTED_MESSAGE = (
     "See: GET /tasks/{id}"
 )
 
+# Cap on concurrently in-flight webhook deliveries; a burst of lifecycle
+# events queues behind the semaphore instead of spawning unbounded tasks.
+MAX_CONCURRENT_NOTIFICATIONS = 64
+
 
 @dataclass
 class PushNotificationManager:
@@ -78,6 +82,11 @@ class PushNotificationManager:
     _notification_sequences: dict[uuid.UUID, int] = field(
         default_factory=dict, init=False
     )
+    _notification_tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+    _notification_semaphore: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_CONCURRENT_NOTIFICATIONS),
+        init=False,
+    )
 
     async def initialize(self) -> None:
         """Initialize the push notification manager.
@@ -353,7 +362,20 @@ class PushNotificationManager:
             return
         if self.get_effective_webhook_config(task_id) is None:
             return
-        asyncio.create_task(self.notify_lifecycle(task_id, context_id, state, final))
+        # Keep a strong reference so in-flight deliveries are not garbage
+        # collected before completing (fire-and-forget create_task pitfall).
+        task = asyncio.create_task(
+            self._notify_lifecycle_bounded(task_id, context_id, state, final)
+        )
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._notification_tasks.discard)
+
+    async def _notify_lifecycle_bounded(
+        self, task_id: uuid.UUID, context_id: uuid.UUID, state: str, final: bool
+    ) -> None:
+        """Deliver a lifecycle notification under the concurrency cap."""
+        async with self._notification_semaphore:
+            await self.notify_lifecycle(task_id, context_id, state, final)
 
     def _jsonrpc_error(
         self, response_class: type, request_id: Any, message: str, code: int = -32001
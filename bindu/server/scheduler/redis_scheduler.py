@@ -2,10 +2,10 @@
 
 from __future__ import annotations as _annotations
 
-import json
 from collections.abc import AsyncIterator
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 from opentelemetry.trace import get_current_span
 
@@ -24,6 +24,15 @@ from .base import (
 
 logger = get_logger("bindu.server.scheduler.redis_scheduler")
 
+# Operation name -> TaskOperation constructor, resolved with one dict lookup
+# per dequeued task instead of an if/elif chain.
+_OPERATION_TYPES = {
+    "run": _RunTask,
+    "cancel": _CancelTask,
+    "pause": _PauseTask,
+    "resume": _ResumeTask,
+}
+
 
 class RedisScheduler(Scheduler):
     """A Redis-based scheduler for distributed task operations.
@@ -153,7 +162,7 @@ class RedisScheduler(Scheduler):
                 logger.error(f"Redis error in receive_task_operations: {e}")
                 # Could add exponential backoff here for production
                 continue
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 # Log deserialization errors but continue
                 logger.error(f"Failed to deserialize task operation: {e}")
                 continue
@@ -182,10 +191,8 @@ class RedisScheduler(Scheduler):
             logger.error(f"Failed to serialize task operation: {e}")
             raise
 
-    def _serialize_task_operation(self, task_operation: TaskOperation) -> str:
-        """Serialize task operation to JSON string for Redis storage."""
-        from uuid import UUID
-
+    def _serialize_task_operation(self, task_operation: TaskOperation) -> bytes:
+        """Serialize task operation to JSON bytes for Redis storage."""
         # Convert span to string representation (spans are not JSON serializable)
         span = task_operation["_current_span"]
 
@@ -208,30 +215,21 @@ class RedisScheduler(Scheduler):
             # If we can't get span context, just use None values
             pass
 
-        # Convert UUIDs to strings in params
-        def convert_uuids(obj):
-            """Recursively convert UUIDs to strings in nested structures."""
-            if isinstance(obj, UUID):
-                return str(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_uuids(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_uuids(item) for item in obj]
-            return obj
-
+        # orjson serializes UUIDs natively (canonical string form), so no
+        # recursive pre-conversion pass over params is needed.
         serializable_task = {
             "operation": task_operation["operation"],
-            "params": convert_uuids(task_operation["params"]),
+            "params": task_operation["params"],
             "span_id": format(span_id, "016x") if span_id else None,
             "trace_id": format(trace_id, "032x") if trace_id else None,
         }
-        return json.dumps(serializable_task)
+        return orjson.dumps(serializable_task)
 
     def _deserialize_task_operation(self, task_data: str) -> TaskOperation:
         """Deserialize task operation from JSON string."""
         from uuid import UUID
 
-        data = json.loads(task_data)
+        data = orjson.loads(task_data)
 
         # Convert string UUIDs back to UUID objects in params
         def convert_strings_to_uuids(obj):
@@ -254,33 +252,16 @@ class RedisScheduler(Scheduler):
         params = convert_strings_to_uuids(data["params"])
         current_span = get_current_span()
 
-        if operation_type == "run":
-            return _RunTask(
-                operation="run",
-                params=params,
-                _current_span=current_span,
-            )
-        elif operation_type == "cancel":
-            return _CancelTask(
-                operation="cancel",
-                params=params,
-                _current_span=current_span,
-            )
-        elif operation_type == "pause":
-            return _PauseTask(
-                operation="pause",
-                params=params,
-                _current_span=current_span,
-            )
-        elif operation_type == "resume":
-            return _ResumeTask(
-                operation="resume",
-                params=params,
-                _current_span=current_span,
-            )
-        else:
+        task_type = _OPERATION_TYPES.get(operation_type)
+        if task_type is None:
             raise ValueError(f"Unknown operation type: {operation_type}")
 
+        return task_type(
+            operation=operation_type,
+            params=params,
+            _current_span=current_span,
+        )
+
     async def get_queue_length(self) -> int:
         """Get the current length of the task queue."""
         if not self._redis_client:
@@ -23,6 +23,7 @@ from __future__ import annotations as _annotations
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, AsyncIterator
 
 import anyio
@@ -100,6 +101,16 @@ class Worker(ABC):
         async for task_operation in self.scheduler.receive_task_operations():
             await self._handle_task_operation(task_operation)
 
+    @cached_property
+    def _operation_handlers(self) -> dict[str, Any]:
+        """Operation name -> bound handler, built once per worker instance."""
+        return {
+            "run": self.run_task,
+            "cancel": self.cancel_task,
+            "pause": self._handle_pause,
+            "resume": self._handle_resume,
+        }
+
     async def _handle_task_operation(self, task_operation: dict[str, Any]) -> None:
         """Dispatch task operation to appropriate handler.
 
@@ -116,13 +127,6 @@ class Worker(ABC):
         - Any exception during execution marks task as 'failed'
         - Preserves OpenTelemetry trace context
         """
-        operation_handlers: dict[str, Any] = {
-            "run": self.run_task,
-            "cancel": self.cancel_task,
-            "pause": self._handle_pause,
-            "resume": self._handle_resume,
-        }
-
         try:
             # Preserve trace context from scheduler
             with use_span(task_operation["_current_span"]):
@@ -130,7 +134,7 @@ class Worker(ABC):
                     f"{task_operation['operation']} task",
                     attributes={"logfire.tags": ["bindu"]},
                 ):
-                    handler = operation_handlers.get(task_operation["operation"])
+                    handler = self._operation_handlers.get(task_operation["operation"])
                     if handler:
                         await handler(task_operation["params"])
                     else:
@@ -13,6 +13,10 @@ from typing import Any, Optional
 from bindu.common.protocol.types import TaskState
 from bindu.settings import app_settings
 
+# Precompiled pattern for extracting {"state": ...} JSON blocks from text.
+# Compiled once at import instead of on every agent response.
+_STATE_JSON_PATTERN = re.compile(r'\{[^{}]*"state"[^{}]*\}', re.DOTALL)
+
 
 class ResponseDetector:
     """Detects and parses agent responses for state transitions.
@@ -67,8 +71,7 @@ class ResponseDetector:
                 pass
 
             # Try extracting JSON from text using regex
-            json_pattern = r'\{[^{}]*"state"[^{}]*\}'
-            matches = re.findall(json_pattern, result, re.DOTALL)
+            matches = _STATE_JSON_PATTERN.findall(result)
 
             for match in matches:
                 try:
@@ -150,13 +150,10 @@ def verify_checksum(binary_path: Path, expected_checksum: str) -> None:
     Raises:
         RuntimeError: If checksum doesn't match
     """
-    sha256 = hashlib.sha256()
-
+    # hashlib.file_digest streams the file through the hash at C level,
+    # avoiding the Python-level read loop and its per-chunk allocations.
     with open(binary_path, "rb") as f:
-        for chunk in iter(lambda: f.read(CHUNK_SIZE * sha256.block_size), b""):
-            sha256.update(chunk)
-
-    calculated = sha256.hexdigest()
+        calculated = hashlib.file_digest(f, "sha256").hexdigest()
 
     if calculated != expected_checksum:
         raise RuntimeError(
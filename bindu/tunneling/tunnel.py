@@ -17,6 +17,11 @@ logger = get_logger("bindu.tunneling.tunnel")
 # Global list to track active tunnels for cleanup
 ACTIVE_TUNNELS: list["Tunnel"] = []
 
+# Patterns for parsing FRP client output, compiled once instead of on
+# every matching line of the startup read loop.
+_PROXY_SUCCESS_PATTERN = re.compile(r"start proxy success:\s*(.+)")
+_SUBDOMAIN_PATTERN = re.compile(r"https?://([^.]+)\.")
+
 
 class Tunnel:
     """Manages an FRP tunnel connection.
@@ -153,7 +158,8 @@ class Tunnel:
         Raises:
             ValueError: If URL cannot be parsed or tunnel fails
         """
-        start_time = time.time()
+        # Monotonic clock: immune to NTP/wallclock jumps while we wait
+        start_time = time.monotonic()
         log_lines: list[str] = []
         url = ""
 
@@ -168,7 +174,7 @@ class Tunnel:
 
         while not url:
             # Check timeout
-            if time.time() - start_time >= app_settings.tunnel.timeout_seconds:
+            if time.monotonic() - start_time >= app_settings.tunnel.timeout_seconds:
                 raise_tunnel_error()
 
             # Check if process died
@@ -189,19 +195,20 @@ class Tunnel:
                 line = line.strip()
                 if line:
                     log_lines.append(line)
-                    logger.debug(f"FRP: {line}")
+                    # Deferred formatting: only built if DEBUG is emitted
+                    logger.debug("FRP: {}", line)
 
                 # Look for success message
                 # FRP output format: "start proxy success" (URL may or may not be included)
                 if "start proxy success" in line:
                     # Try to extract URL from line if present
-                    match = re.search(r"start proxy success:\s*(.+)", line)
+                    match = _PROXY_SUCCESS_PATTERN.search(line)
                     if match:
                         url = match.group(1).strip()
                         # Update subdomain if it was auto-generated
                         if not self.config.subdomain:
                             # Extract subdomain from URL
-                            subdomain_match = re.search(r"https?://([^.]+)\.", url)
+                            subdomain_match = _SUBDOMAIN_PATTERN.search(url)
                             if subdomain_match:
                                 self.config.subdomain = subdomain_match.group(1)
                     else:
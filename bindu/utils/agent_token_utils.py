@@ -10,11 +10,58 @@ from typing import Optional
 
 from bindu.auth.hydra.registration import load_agent_credentials
 from bindu.settings import app_settings
-from bindu.utils.http_client import http_client
+from bindu.utils.http_client import AsyncHTTPClient
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.utils.token_utils")
 
+# Shared client for Hydra token requests. All grants target the same
+# public URL, so one session keeps the TCP/TLS connection warm instead
+# of paying a handshake per token request.
+_token_client: AsyncHTTPClient | None = None
+
+# Shared HydraClient for introspection/revocation - same rationale: reuse
+# the underlying pooled session rather than rebuilding it per call.
+_hydra_client = None
+
+
+def _get_hydra_client():
+    """Get or lazily create the shared HydraClient."""
+    global _hydra_client
+    if _hydra_client is None:
+        from bindu.auth.hydra.client import HydraClient
+
+        _hydra_client = HydraClient(
+            admin_url=app_settings.hydra.admin_url,
+            public_url=app_settings.hydra.public_url,
+            timeout=app_settings.hydra.timeout,
+            verify_ssl=app_settings.hydra.verify_ssl,
+        )
+    return _hydra_client
+
+
+def _get_token_client() -> AsyncHTTPClient:
+    """Get or lazily create the shared Hydra token client."""
+    global _token_client
+    if _token_client is None:
+        _token_client = AsyncHTTPClient(
+            base_url=app_settings.hydra.public_url,
+            verify_ssl=app_settings.hydra.verify_ssl,
+            timeout=app_settings.hydra.timeout,
+        )
+    return _token_client
+
+
+async def close_token_client() -> None:
+    """Close the shared client sessions (call on shutdown)."""
+    global _token_client, _hydra_client
+    if _token_client is not None:
+        await _token_client.close()
+        _token_client = None
+    if _hydra_client is not None:
+        await _hydra_client.close()
+        _hydra_client = None
+
 
 async def get_client_credentials_token(
     client_id: str, client_secret: str, scope: Optional[str] = None
@@ -45,23 +92,19 @@ async def get_client_credentials_token(
         if scope:
             data["scope"] = scope
 
-        async with http_client(
-            base_url=app_settings.hydra.public_url,
-            verify_ssl=app_settings.hydra.verify_ssl,
-            timeout=app_settings.hydra.timeout,
-        ) as client:
-            response = await client.post("/oauth2/token", headers=headers, data=data)
-
-            if response.status == 200:
-                result = await response.json()
-                logger.debug(f"Token obtained for client: {client_id}")
-                return result
-            else:
-                error_text = await response.text()
-                logger.error(
-                    f"Failed to get token for {client_id}: {response.status} - {error_text}"
-                )
-                return None
+        client = _get_token_client()
+        response = await client.post("/oauth2/token", headers=headers, data=data)
+
+        if response.status == 200:
+            result = await response.json()
+            logger.debug(f"Token obtained for client: {client_id}")
+            return result
+        else:
+            error_text = await response.text()
+            logger.error(
+                f"Failed to get token for {client_id}: {response.status} - {error_text}"
+            )
+            return None
 
     except Exception as e:
         logger.error(f"Failed to get client credentials token: {e}")
@@ -107,17 +150,9 @@ async def introspect_token(token: str) -> Optional[dict]:
     Returns:
         Introspection result dict or None
     """
-    from bindu.auth.hydra.client import HydraClient
-
     try:
-        async with HydraClient(
-            admin_url=app_settings.hydra.admin_url,
-            public_url=app_settings.hydra.public_url,
-            timeout=app_settings.hydra.timeout,
-            verify_ssl=app_settings.hydra.verify_ssl,
-        ) as hydra:
-            result = await hydra.introspect_token(token)
-            return result
+        result = await _get_hydra_client().introspect_token(token)
+        return result
 
     except Exception as e:
         logger.error(f"Failed to introspect token: {e}")
@@ -133,16 +168,8 @@ async def revoke_token(token: str) -> bool:
     Returns:
         True if revoked successfully, False otherwise
     """
-    from bindu.auth.hydra.client import HydraClient
-
     try:
-        async with HydraClient(
-            admin_url=app_settings.hydra.admin_url,
-            public_url=app_settings.hydra.public_url,
-            timeout=app_settings.hydra.timeout,
-            verify_ssl=app_settings.hydra.verify_ssl,
-        ) as hydra:
-            return await hydra.revoke_token(token)
+        return await _get_hydra_client().revoke_token(token)
 
     except Exception as e:
         logger.error(f"Failed to revoke token: {e}")
@@ -11,6 +11,18 @@ from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.utils.config_loader")
 
+# Optional Hydra connection settings: env var -> (config key, value converter).
+# Scanned in one pass by load_config_from_env instead of a per-key if chain.
+_HYDRA_ENV_VARS: tuple[tuple[str, str, Any], ...] = (
+    ("HYDRA__ADMIN_URL", "admin_url", str),
+    ("HYDRA__PUBLIC_URL", "public_url", str),
+    ("HYDRA__TIMEOUT", "timeout", int),
+    ("HYDRA__MAX_RETRIES", "max_retries", int),
+    ("HYDRA__CACHE_TTL", "cache_ttl", int),
+    ("HYDRA__MAX_CACHE_SIZE", "max_cache_size", int),
+    ("HYDRA__AGENT_CLIENT_PREFIX", "agent_client_prefix", str),
+)
+
 
 def create_storage_config_from_env(user_config: Dict[str, Any]):
     """Create StorageConfig from environment variables and user config.
@@ -363,22 +375,14 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
 
             # Load provider-specific configuration
             if auth_provider == "hydra":
-                hydra_admin_url = os.getenv("HYDRA__ADMIN_URL")
-                if hydra_admin_url:
-                    enriched_config["auth"]["admin_url"] = hydra_admin_url
-                    logger.debug("Loaded HYDRA__ADMIN_URL from environment")
-
-                hydra_public_url = os.getenv("HYDRA__PUBLIC_URL")
-                if hydra_public_url:
-                    enriched_config["auth"]["public_url"] = hydra_public_url
-                    logger.debug("Loaded HYDRA__PUBLIC_URL from environment")
-
-                # Connection settings
-                hydra_timeout = os.getenv("HYDRA__TIMEOUT")
-                if hydra_timeout:
-                    enriched_config["auth"]["timeout"] = int(hydra_timeout)
-                    logger.debug("Loaded HYDRA__TIMEOUT from environment")
-
+                # Optional connection/cache settings in one table-driven pass
+                for env_var, config_key, convert in _HYDRA_ENV_VARS:
+                    value = os.getenv(env_var)
+                    if value:
+                        enriched_config["auth"][config_key] = convert(value)
+                        logger.debug(f"Loaded {env_var} from environment")
+
+                # Boolean settings with defaults (always set)
                 hydra_verify_ssl = os.getenv("HYDRA__VERIFY_SSL", "true").lower() in (
                     "true",
                     "1",
@@ -387,36 +391,12 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
                 enriched_config["auth"]["verify_ssl"] = hydra_verify_ssl
                 logger.debug("Loaded HYDRA__VERIFY_SSL from environment")
 
-                hydra_max_retries = os.getenv("HYDRA__MAX_RETRIES")
-                if hydra_max_retries:
-                    enriched_config["auth"]["max_retries"] = int(hydra_max_retries)
-                    logger.debug("Loaded HYDRA__MAX_RETRIES from environment")
-
-                # Cache settings
-                hydra_cache_ttl = os.getenv("HYDRA__CACHE_TTL")
-                if hydra_cache_ttl:
-                    enriched_config["auth"]["cache_ttl"] = int(hydra_cache_ttl)
-                    logger.debug("Loaded HYDRA__CACHE_TTL from environment")
-
-                hydra_max_cache_size = os.getenv("HYDRA__MAX_CACHE_SIZE")
-                if hydra_max_cache_size:
-                    enriched_config["auth"]["max_cache_size"] = int(
-                        hydra_max_cache_size
-                    )
-                    logger.debug("Loaded HYDRA__MAX_CACHE_SIZE from environment")
-
-                # Auto-registration settings
                 hydra_auto_register = os.getenv(
                     "HYDRA__AUTO_REGISTER_AGENTS", "true"
                 ).lower() in ("true", "1", "yes")
                 enriched_config["auth"]["auto_register_agents"] = hydra_auto_register
                 logger.debug("Loaded HYDRA__AUTO_REGISTER_AGENTS from environment")
 
-                hydra_client_prefix = os.getenv("HYDRA__AGENT_CLIENT_PREFIX")
-                if hydra_client_prefix:
-                    enriched_config["auth"]["agent_client_prefix"] = hydra_client_prefix
-                    logger.debug("Loaded HYDRA__AGENT_CLIENT_PREFIX from environment")
-
     return enriched_config
 
 
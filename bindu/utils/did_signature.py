@@ -8,7 +8,7 @@ from __future__ import annotations as _annotations
 
 import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from bindu.utils.logging import get_logger
 
@@ -134,11 +134,12 @@ def verify_signature(
         return False
 
 
-def extract_signature_headers(headers: dict) -> Optional[Dict[str, Any]]:
+def extract_signature_headers(headers: Mapping[str, str]) -> Optional[Dict[str, Any]]:
     """Extract DID signature headers from request.
 
     Args:
-        headers: Request headers dict
+        headers: Request headers mapping (a plain dict or Starlette's
+            case-insensitive Headers object - only .get() is used)
 
     Returns:
         Dict with did, signature, timestamp or None if missing
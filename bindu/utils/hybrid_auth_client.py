@@ -15,7 +15,10 @@ from bindu.auth.hydra.registration import load_agent_credentials
 from bindu.utils.did_signature import create_signed_request_headers
 from bindu.utils.http_client import AsyncHTTPClient
 from bindu.utils.logging import get_logger
-from bindu.utils.agent_token_utils import get_client_credentials_token
+from bindu.utils.agent_token_utils import (
+    close_token_client,
+    get_client_credentials_token,
+)
 
 logger = get_logger("bindu.utils.hybrid_auth_client")
 
@@ -47,6 +50,7 @@ class HybridAuthClient:
         self.did_extension = did_extension
         self.credentials = None
         self.access_token = None
+        self._http_clients: Dict[str, AsyncHTTPClient] = {}
 
     async def initialize(self):
         """Load credentials and get initial access token."""
@@ -58,6 +62,31 @@ class HybridAuthClient:
         # Get access token
         await self.refresh_token()
 
+    def _get_client(self, base_url: str) -> AsyncHTTPClient:
+        """Get or create a reusable HTTP client for a base URL.
+
+        Clients are cached per base URL so repeated requests to the same
+        agent reuse the underlying session instead of paying connection
+        setup/teardown on every call.
+        """
+        client = self._http_clients.get(base_url)
+        if client is None:
+            client = AsyncHTTPClient(base_url=base_url)
+            self._http_clients[base_url] = client
+        return client
+
+    async def close(self):
+        """Close all cached HTTP client sessions.
+
+        Also closes the shared Hydra token client so script-side callers
+        (which never run the server lifespan shutdown) do not leak its
+        aiohttp session.
+        """
+        for client in self._http_clients.values():
+            await client.close()
+        self._http_clients.clear()
+        await close_token_client()
+
     async def refresh_token(self):
         """Get a new access token from Hydra."""
         scope = " ".join(self.credentials.scopes)
@@ -111,29 +140,29 @@ class HybridAuthClient:
         if headers:
             auth_headers.update(headers)
 
-        # Make request
-        async with AsyncHTTPClient(base_url=base_url) as client:
-            response = await client.post(path, headers=auth_headers, data=body_str)
-
-            if response.status == 401:
-                # Token might be expired, refresh and retry
-                logger.info("Token expired, refreshing...")
-                await self.refresh_token()
+        # Make request on the cached per-host client
+        client = self._get_client(base_url)
+        response = await client.post(path, headers=auth_headers, data=body_str)
 
-                # Update headers with new token
-                auth_headers = create_signed_request_headers(
-                    body=body_str,
-                    did=self.credentials.client_id,
-                    did_extension=self.did_extension,
-                    bearer_token=self.access_token,
-                )
-                if headers:
-                    auth_headers.update(headers)
+        if response.status == 401:
+            # Token might be expired, refresh and retry
+            logger.info("Token expired, refreshing...")
+            await self.refresh_token()
 
-                # Retry request
-                response = await client.post(path, headers=auth_headers, data=body_str)
+            # Update headers with new token
+            auth_headers = create_signed_request_headers(
+                body=body_str,
+                did=self.credentials.client_id,
+                did_extension=self.did_extension,
+                bearer_token=self.access_token,
+            )
+            if headers:
+                auth_headers.update(headers)
+
+            # Retry request
+            response = await client.post(path, headers=auth_headers, data=body_str)
 
-            return await response.json()
+        return await response.json()
 
     async def get(
         self,
@@ -170,19 +199,19 @@ class HybridAuthClient:
         if headers:
             auth_headers.update(headers)
 
-        # Make request
-        async with AsyncHTTPClient(base_url=base_url) as client:
-            response = await client.get(path, headers=auth_headers)
+        # Make request on the cached per-host client
+        client = self._get_client(base_url)
+        response = await client.get(path, headers=auth_headers)
 
-            if response.status == 401:
-                # Token might be expired, refresh and retry
-                logger.info("Token expired, refreshing...")
-                await self.refresh_token()
+        if response.status == 401:
+            # Token might be expired, refresh and retry
+            logger.info("Token expired, refreshing...")
+            await self.refresh_token()
 
-                auth_headers["Authorization"] = f"Bearer {self.access_token}"
-                response = await client.get(path, headers=auth_headers)
+            auth_headers["Authorization"] = f"Bearer {self.access_token}"
+            response = await client.get(path, headers=auth_headers)
 
-            return await response.json()
+        return await response.json()
 
 
 async def make_authenticated_request(
@@ -213,12 +242,15 @@ async def make_authenticated_request(
     client = HybridAuthClient(agent_id, credentials_dir, did_extension)
     await client.initialize()
 
-    if method.upper() == "POST":
-        return await client.post(url, data or {}, headers)
-    elif method.upper() == "GET":
-        return await client.get(url, headers)
-    else:
-        raise ValueError(f"Unsupported method: {method}")
+    try:
+        if method.upper() == "POST":
+            return await client.post(url, data or {}, headers)
+        elif method.upper() == "GET":
+            return await client.get(url, headers)
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+    finally:
+        await client.close()
 
 
 async def call_agent_with_hybrid_auth(
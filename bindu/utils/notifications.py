@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from typing import Any
 from urllib import error, request
 from urllib.parse import urlparse
 
+import orjson
+
 from bindu.common.protocol.types import PushNotificationConfig
 from bindu.utils.logging import get_logger
 
@@ -51,7 +52,9 @@ class NotificationService:
         """Send an event to the configured HTTP webhook."""
         self.validate_config(config)
 
-        payload = json.dumps(event, separators=(",", ":")).encode("utf-8")
+        # orjson emits compact UTF-8 bytes directly - one serialization pass
+        # instead of json.dumps + a full .encode() copy of the payload.
+        payload = orjson.dumps(event)
         headers = self._build_headers(config)
 
         await self._post_with_retries(config["url"], headers, payload, event)
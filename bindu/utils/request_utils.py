@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Tuple, Type, get_args
 
 from starlette.requests import Request
@@ -26,11 +26,16 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+@lru_cache(maxsize=None)
 def extract_error_fields(err_alias: Type[Any]) -> Tuple[int, str]:
     """Extract error code and message from JSONRPCError type alias.
 
     Given a JSONRPCError[Literal[code], Literal[message]] typing alias,
     return (code, message) as runtime values.
+
+    The error aliases are a small fixed set defined at import time, so the
+    typing introspection is memoized instead of re-walking the alias on
+    every error response.
     """
     code_lit, msg_lit = get_args(err_alias)
     (code,) = get_args(code_lit)
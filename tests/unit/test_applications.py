@@ -203,29 +203,29 @@ class TestBinduApplicationLifespan:
 
         app = BinduApplication(manifest=mock_manifest)
 
-        with patch(
-            "bindu.server.storage.factory.create_storage"
-        ) as mock_create_storage:
+        # Single with-statement keeps the patch setup flat instead of one
+        # indentation level per mock
+        with (
+            patch("bindu.server.storage.factory.create_storage") as mock_create_storage,
+            patch("bindu.server.storage.factory.close_storage") as mock_close,
+            patch("bindu.server.task_manager.TaskManager") as mock_tm,
+        ):
             mock_storage = MagicMock()
             mock_create_storage.return_value = mock_storage
 
-            with patch("bindu.server.storage.factory.close_storage") as mock_close:
-                with patch("bindu.server.task_manager.TaskManager") as mock_tm:
-                    mock_tm_instance = MagicMock()
-                    mock_tm_instance.__aenter__ = AsyncMock(
-                        return_value=mock_tm_instance
-                    )
-                    mock_tm_instance.__aexit__ = AsyncMock()
-                    mock_tm.return_value = mock_tm_instance
+            mock_tm_instance = MagicMock()
+            mock_tm_instance.__aenter__ = AsyncMock(return_value=mock_tm_instance)
+            mock_tm_instance.__aexit__ = AsyncMock()
+            mock_tm.return_value = mock_tm_instance
 
-                    # Test the lifespan function directly
-                    lifespan_func = app._create_default_lifespan(mock_manifest)
-                    async with lifespan_func(app):
-                        assert app._storage is not None
-                        assert app._scheduler is not None
+            # Test the lifespan function directly
+            lifespan_func = app._create_default_lifespan(mock_manifest)
+            async with lifespan_func(app):
+                assert app._storage is not None
+                assert app._scheduler is not None
 
-                    mock_create_storage.assert_called_once()
-                    mock_close.assert_called_once_with(mock_storage)
+            mock_create_storage.assert_called_once()
+            mock_close.assert_called_once_with(mock_storage)
 
     @pytest.mark.asyncio
     async def test_lifespan_without_manifest(self):
@@ -235,21 +235,21 @@ class TestBinduApplicationLifespan:
         mock_manifest.capabilities = {}
         app = BinduApplication(manifest=mock_manifest)
 
-        with patch(
-            "bindu.server.storage.factory.create_storage"
-        ) as mock_create_storage:
+        with (
+            patch("bindu.server.storage.factory.create_storage") as mock_create_storage,
+            patch("bindu.server.storage.factory.close_storage") as mock_close,
+        ):
             mock_storage = MagicMock()
             mock_create_storage.return_value = mock_storage
 
-            with patch("bindu.server.storage.factory.close_storage") as mock_close:
-                # Test the lifespan function with None manifest
-                lifespan_func = app._create_default_lifespan(None)
-                async with lifespan_func(app):
-                    assert app._storage is not None
-                    assert app._scheduler is not None
+            # Test the lifespan function with None manifest
+            lifespan_func = app._create_default_lifespan(None)
+            async with lifespan_func(app):
+                assert app._storage is not None
+                assert app._scheduler is not None
 
-                mock_create_storage.assert_called_once()
-                mock_close.assert_called_once_with(mock_storage)
+            mock_create_storage.assert_called_once()
+            mock_close.assert_called_once_with(mock_storage)
 
     @pytest.mark.asyncio
     async def test_lifespan_with_postgres_storage_config(self):
@@ -262,21 +262,21 @@ class TestBinduApplicationLifespan:
         mock_manifest.capabilities = {}
         app = BinduApplication(storage_config=storage_config, manifest=mock_manifest)
 
-        with patch(
-            "bindu.server.storage.factory.create_storage"
-        ) as mock_create_storage:
+        with (
+            patch("bindu.server.storage.factory.create_storage") as mock_create_storage,
+            patch("bindu.server.storage.factory.close_storage") as mock_close,
+        ):
             mock_storage = MagicMock()
             mock_create_storage.return_value = mock_storage
 
-            with patch("bindu.server.storage.factory.close_storage") as mock_close:
-                # Test the lifespan function
-                lifespan_func = app._create_default_lifespan(mock_manifest)
-                async with lifespan_func(app):
-                    # Storage should be initialized
-                    assert app._storage is not None
+            # Test the lifespan function
+            lifespan_func = app._create_default_lifespan(mock_manifest)
+            async with lifespan_func(app):
+                # Storage should be initialized
+                assert app._storage is not None
 
-                mock_create_storage.assert_called_once()
-                mock_close.assert_called_once_with(mock_storage)
+            mock_create_storage.assert_called_once()
+            mock_close.assert_called_once_with(mock_storage)
 
     @pytest.mark.asyncio
     async def test_lifespan_with_memory_storage_config(self):
@@ -287,20 +287,20 @@ class TestBinduApplicationLifespan:
         mock_manifest.capabilities = {}
         app = BinduApplication(storage_config=storage_config, manifest=mock_manifest)
 
-        with patch(
-            "bindu.server.storage.factory.create_storage"
-        ) as mock_create_storage:
+        with (
+            patch("bindu.server.storage.factory.create_storage") as mock_create_storage,
+            patch("bindu.server.storage.factory.close_storage") as mock_close,
+        ):
             mock_storage = MagicMock()
             mock_create_storage.return_value = mock_storage
 
-            with patch("bindu.server.storage.factory.close_storage") as mock_close:
-                # Test the lifespan function
-                lifespan_func = app._create_default_lifespan(mock_manifest)
-                async with lifespan_func(app):
-                    assert app._storage is not None
+            # Test the lifespan function
+            lifespan_func = app._create_default_lifespan(mock_manifest)
+            async with lifespan_func(app):
+                assert app._storage is not None
 
-                mock_create_storage.assert_called_once()
-                mock_close.assert_called_once_with(mock_storage)
+            mock_create_storage.assert_called_once()
+            mock_close.assert_called_once_with(mock_storage)
 
 
 class TestBinduApplicationObservability:
@@ -366,20 +366,22 @@ class TestBinduApplicationPaymentSessions:
                 app._payment_session_manager.start_cleanup_task = AsyncMock()  # type: ignore[assignment]
                 app._payment_session_manager.stop_cleanup_task = AsyncMock()  # type: ignore[assignment]
 
-                with patch(
-                    "bindu.server.storage.factory.create_storage"
-                ) as mock_create_storage:
+                with (
+                    patch(
+                        "bindu.server.storage.factory.create_storage"
+                    ) as mock_create_storage,
+                    patch("bindu.server.storage.factory.close_storage"),
+                ):
                     mock_storage = MagicMock()
                     mock_storage.__aenter__ = AsyncMock(return_value=mock_storage)
                     mock_storage.__aexit__ = AsyncMock()
                     mock_create_storage.return_value = mock_storage
 
-                    with patch("bindu.server.storage.factory.close_storage"):
-                        async with app:
-                            pass
+                    async with app:
+                        pass
 
-                        app._payment_session_manager.start_cleanup_task.assert_called_once()
-                        app._payment_session_manager.stop_cleanup_task.assert_called_once()
+                    app._payment_session_manager.start_cleanup_task.assert_called_once()
+                    app._payment_session_manager.stop_cleanup_task.assert_called_once()
 
 
 class TestBinduApplicationEdgeCases: